@@ -1,5 +1,3 @@
-from abc import ABC, abstractmethod
-
 """
 Implementation of Abstract Factory in python (3.12.1)
 Run using the following command:
@@ -7,68 +5,88 @@ Run using the following command:
 """
 
 # Abstract Product A: Beverage
-class Beverage(ABC):
-    @abstractmethod
-    def serve():
-        pass
+class Beverage:
+    __slots__ = ()
+
+    def serve(self):
+        raise NotImplementedError
 
 # Concrete Product A1: Coffee
 class Coffee(Beverage):
+    __slots__ = ()
+
     def serve(self):
         print('Here\'s your coffee!')
 
 # Concrete Product A2: Tea
 class Tea(Beverage):
+    __slots__ = ()
+
     def serve(self):
         print('Here\'s your tea!')
 
 # Abstract Product B: Topping
-class Topping(ABC):
-    @abstractmethod
+class Topping:
+    __slots__ = ()
+
     def add(self):
-        pass
+        raise NotImplementedError
 
 # Concrete Product B1: Milk
 class Milk(Topping):
+    __slots__ = ()
+
     def add(self):
         print('Adding Milk...')
 
 # Concrete Product B2: Sugar
 class Sugar(Topping):
+    __slots__ = ()
+
     def add(self):
         print('Adding Sugar...')
 
+# Shared product instances (the products are stateless)
+_COFFEE = Coffee()
+_TEA = Tea()
+_MILK = Milk()
+_SUGAR = Sugar()
+
 # Abstract Factory: BeverageFactory
-class BeverageFactory(ABC):
-    @abstractmethod
-    def createBeverage(self):
-        pass
+class BeverageFactory:
+    @staticmethod
+    def createBeverage():
+        raise NotImplementedError
 
-    @abstractmethod
-    def createTopping(self):
-        pass
+    @staticmethod
+    def createTopping():
+        raise NotImplementedError
 
 # Concrete Factory A1 and B1: CoffeeFactory
 class CoffeeFactory(BeverageFactory):
-    def createBeverage(self):
-        return Coffee()
+    @staticmethod
+    def createBeverage():
+        return _COFFEE
 
-    def createTopping(self):
-        return Milk()
+    @staticmethod
+    def createTopping():
+        return _MILK
 
 # Concrete Factory A2 and B2: TeaFactory
 class TeaFactory(BeverageFactory):
-    def createBeverage(self):
-        return Tea()
+    @staticmethod
+    def createBeverage():
+        return _TEA
 
-    def createTopping(self):
-        return Sugar()
+    @staticmethod
+    def createTopping():
+        return _SUGAR
 
 # Client
 class Customer:
-    def __init__(self, bev: Beverage):
-        self.bev = bev.createBeverage()
-        self.top = bev.createTopping()
+    def __init__(self, factory: type[BeverageFactory]):
+        self.bev = factory.createBeverage()
+        self.top = factory.createTopping()
     
     def enjoy(self):
         self.bev.serve()
@@ -76,15 +94,12 @@ class Customer:
 
 # Application
 def main():
-    coffee_factory = CoffeeFactory()
-    tea_factory = TeaFactory()
-
-    coffee_lover = Customer(coffee_factory)
+    coffee_lover = Customer(CoffeeFactory)
     coffee_lover.enjoy()
 
     print()
     
-    tea_lover = Customer(tea_factory)
+    tea_lover = Customer(TeaFactory)
     tea_lover.enjoy()
 
 if __name__ == '__main__':
@@ -1,4 +1,3 @@
-from abc import ABC, abstractmethod
 """
 This program is using the same domain as the Java program for the Builder.
 However the implementation is a LITTLE BIT different!
@@ -13,6 +12,8 @@ This is just another way to implement the builder pattern.
 
 # Product A: Pizza
 class Pizza:
+    __slots__ = ('size', 'crustType', 'toppings')
+
     def __init__(self) -> None:
         self.size = "N/A"
         self.crustType = "N/A"
@@ -23,6 +24,8 @@ class Pizza:
 
 # Product B: Sandwich
 class Sandwich:
+    __slots__ = ('size', 'breadType', 'toppings')
+
     def __init__(self) -> None:
         self.size = "N/A"
         self.breadType = "N/A"
@@ -32,21 +35,22 @@ class Sandwich:
         return f"Sandwich: size={self.size}, breadType={self.breadType}, toppings={self.toppings}"
 
 # Builder Interface: Builder
-class Builder(ABC):
-    @abstractmethod
-    def setSize():
-        pass
+class Builder:
+    __slots__ = ()
+
+    def setSize(self):
+        raise NotImplementedError
 
-    @abstractmethod
-    def setType():
-        pass
+    def setType(self):
+        raise NotImplementedError
 
-    @abstractmethod
-    def addTopping():
-        pass
+    def addTopping(self):
+        raise NotImplementedError
 
 # Concrete Builder A: PizzaBuilder
 class PizzaBuilder(Builder):
+    __slots__ = ('product',)
+
     def __init__(self) -> None:
         self.reset()
     
@@ -72,6 +76,8 @@ class PizzaBuilder(Builder):
 
 # Concrete Builder B: SandwichBuilder
 class SandwichBuilder(Builder):
+    __slots__ = ('product',)
+
     def __init__(self) -> None:
         self.reset()
     
@@ -1,45 +1,52 @@
-from abc import ABC, abstractmethod
-
 # Abstract Product: Vehicle
-class Vehicle(ABC):
-    @abstractmethod
-    def drive():
-        pass
+class Vehicle:
+    __slots__ = ()
+
+    def drive(self):
+        raise NotImplementedError
 
 # Concrete Product A: Car
 class Car(Vehicle):
+    __slots__ = ()
+
     def drive(self):
         print('Driving a car!')
 
 # Concrete Product B: Motorcycle
 class Motorcycle(Vehicle):
+    __slots__ = ()
+
     def drive(self):
         print('Driving a motorcycle!')
 
+# Shared product instances (the products are stateless)
+_CAR = Car()
+_MOTORCYCLE = Motorcycle()
+
 # Abstract Factory: VehicleFactory
-class VehicleFactory(ABC):
-    @abstractmethod
+class VehicleFactory:
+    @staticmethod
     def createVehicle():
-        pass
+        raise NotImplementedError
 
 # Concrete Factory A: CarFactory
 class CarFactory(VehicleFactory):
-    def createVehicle(self):
-        return Car()
+    @staticmethod
+    def createVehicle():
+        return _CAR
 
 # Concrete Factory B: MotorcycleFactory
 class MotorcycleFactory(VehicleFactory):
-    def createVehicle(self):
-        return Motorcycle()
+    @staticmethod
+    def createVehicle():
+        return _MOTORCYCLE
 
 # Client Program
 def  main ():
-    car_factory = CarFactory()
-    car = car_factory.createVehicle()
+    car = CarFactory.createVehicle()
     car.drive()
 
-    motor_factory = MotorcycleFactory()
-    motorcycle = motor_factory.createVehicle()
+    motorcycle = MotorcycleFactory.createVehicle()
     motorcycle.drive()
 
 if __name__ == '__main__':
@@ -1,18 +1,19 @@
-from abc import ABC, abstractmethod
+from copy import copy
+import logging
+import sys
+
+logger = logging.getLogger(__name__)
 
 # Abstract Product A: Beverage
-class Beverage(ABC):
-    @abstractmethod
-    def setBeverageType(type: str) -> None:
-        pass
+class Beverage:
+    def setBeverageType(self, type: str) -> None:
+        raise NotImplementedError
 
-    @abstractmethod
-    def serve() -> None:
-        pass
+    def serve(self) -> None:
+        raise NotImplementedError
 
-    @abstractmethod
-    def cloneBeverage():
-        pass
+    def cloneBeverage(self):
+        raise NotImplementedError
 
 # Concrete Product A1: Coffee
 class Coffee(Beverage):
@@ -24,10 +25,10 @@ class Coffee(Beverage):
         self.coffeeType = type
     
     def serve(self) -> None:
-        print(f"Here's your {self.coffeeType} coffee!")
+        logger.info("Here's your %s coffee!", self.coffeeType)
     
     def cloneBeverage(self) -> Beverage:
-        return Coffee()
+        return copy(self)
 
 # Concrete Product A2: Tea
 class Tea(Beverage):
@@ -39,24 +40,21 @@ class Tea(Beverage):
         self.teaType = type
     
     def serve(self) -> None:
-        print(f"Here's your {self.teaType} tea!")
+        logger.info("Here's your %s tea!", self.teaType)
     
     def cloneBeverage(self) -> Beverage:
-        return Tea()
+        return copy(self)
 
 # Abstract Product B: Topping
-class Topping(ABC):
-    @abstractmethod
-    def setToppingName(name: str) -> None:
-        pass
+class Topping:
+    def setToppingName(self, name: str) -> None:
+        raise NotImplementedError
 
-    @abstractmethod
-    def add() -> None:
-        pass
+    def add(self) -> None:
+        raise NotImplementedError
 
-    @abstractmethod
-    def cloneTopping():
-        pass
+    def cloneTopping(self):
+        raise NotImplementedError
 
 # Concrete Product B1: Milk
 class Milk(Topping):
@@ -68,10 +66,10 @@ class Milk(Topping):
         self.name = name
     
     def add(self) -> None:
-        print(f"Adding {self.name} Milk...")
+        logger.info("Adding %s Milk...", self.name)
     
     def cloneTopping(self) -> Topping:
-        return Milk()
+        return copy(self)
 
 # Concrete Product B2: Sugar
 class Sugar(Topping):
@@ -83,20 +81,18 @@ class Sugar(Topping):
         self.name = name
     
     def add(self) -> None:
-        print(f"Adding {self.name} Sugar...")
+        logger.info("Adding %s Sugar...", self.name)
 
     def cloneTopping(self) -> Topping:
-        return Sugar()
+        return copy(self)
 
 # Abstract Factory: ProductFactory
-class ProductFactory(ABC):
-    @abstractmethod
-    def createBeverage() -> Beverage:
-        pass
+class ProductFactory:
+    def createBeverage(self) -> Beverage:
+        raise NotImplementedError
 
-    @abstractmethod
-    def createTopping() -> Topping:
-        pass
+    def createTopping(self) -> Topping:
+        raise NotImplementedError
 
 # Concrete Factory: PrototypeFactory
 class PrototypeFactory(ProductFactory):
@@ -126,6 +122,8 @@ class Customer:
         self.topping.add()
 
 def main():
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+
     coffee = Coffee()
     tea = Tea()
     milk = Milk()
@@ -17,14 +17,22 @@ class SingletonMeta(type):
     When you call the metaclass(e.g. Singleton()) this method is invoked.
     """
     def __call__(cls, *args, **kargs):
+        # Fast path: once the Singleton exists, a plain dictionary lookup is enough
+        # and no thread has to wait on the lock to get it
+        instance = cls._instances.get(cls)
+        if instance is not None:
+            return instance
+
         # with cls._lock
         # Ensures that only one thread can execute the critical section of code at a time
         # thus making the creation of the Singleton thread safe
         with cls._lock:
-            # This condition checks if the class (not instance) is already in the _instances
-            # dictionary. If the class is not present, it means that no instance of this class
+            # Another thread may have created the instance while this one was waiting on
+            # the lock, so check the _instances dictionary again (double-checked locking).
+            # If the class is not present, it means that no instance of this class
             # has been created yet.
-            if cls not in cls._instances:
+            instance = cls._instances.get(cls)
+            if instance is None:
                 # If new instance needs to be created, this line invokes the __call__ method
                 # of the superclass (typically type), effectively creating a new instance
                 # of the class (cls) . The *args and **kargs are passed to the constructor
@@ -34,7 +42,7 @@ class SingletonMeta(type):
                 # newly created instance as its value in the _instances dictionary. This ensures
                 # that only one instance of the class is ever created and stored
                 cls._instances[cls] = instance
-        return cls._instances[cls]
+        return instance
 
 class Singleton(metaclass=SingletonMeta):
     value: str = None
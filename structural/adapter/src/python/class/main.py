@@ -1,5 +1,17 @@
-from abc import ABC, abstractmethod
-from re import search
+_HEAD = '<message>'
+_TAIL = '</message>'
+_HEAD_LEN = len(_HEAD)
+
+# Find the content between the <message> tags with two plain string scans
+def extractMessage(data: str) -> str | None:
+    start = data.find(_HEAD)
+    if start == -1:
+        return None
+    start += _HEAD_LEN
+    end = data.find(_TAIL, start)
+    if end == -1:
+        return None
+    return data[start:end]
 
 # Adaptee JSON Implementation of Adaptee Interface
 class JsonLogger:
@@ -19,18 +31,15 @@ class XmlData:
         self.data = data
 
 # Client/Target Interface
-class XmlLogger(ABC):
-    @abstractmethod
-    def logXmlData(data: XmlData) -> None:
-        pass
+class XmlLogger:
+    def logXmlData(self, data: XmlData) -> None:
+        raise NotImplementedError
 
 # Adapter
 class XmlToJsonAdapter(JsonLogger):
     def logXmlData(self, xmlData: XmlData) -> None:
-        # Use a regular expression to find the content between the <message> tags
-        match = search(r'<message>(.*?)</message>', xmlData.data)
-        if match:
-            message_content = match.group(1)
+        message_content = extractMessage(xmlData.data)
+        if message_content is not None:
             super().log(message_content)
         else:
             print("No message tag found.")
@@ -38,10 +47,8 @@ class XmlToJsonAdapter(JsonLogger):
 # Adapter
 class XmlToYamlAdapter(YamlLogger):
     def logXmlData(self, xmlData: XmlData) -> None:
-        # Use a regular expression to find the content between the <message> tags
-        match = search(r'<message>(.*?)</message>', xmlData.data)
-        if match:
-            message_content = match.group(1)
+        message_content = extractMessage(xmlData.data)
+        if message_content is not None:
             super().log(message_content)
         else:
             print("No message tag found.")
@@ -1,11 +1,22 @@
-from abc import ABC, abstractmethod
-from re import search
+_HEAD = '<message>'
+_TAIL = '</message>'
+_HEAD_LEN = len(_HEAD)
+
+# Find the content between the <message> tags with two plain string scans
+def extractMessage(data: str) -> str | None:
+    start = data.find(_HEAD)
+    if start == -1:
+        return None
+    start += _HEAD_LEN
+    end = data.find(_TAIL, start)
+    if end == -1:
+        return None
+    return data[start:end]
 
 # Adaptee Interface (Represents existing system)
-class Logger(ABC):
-    @abstractmethod
-    def log(data: str) -> None:
-        pass
+class Logger:
+    def log(self, data: str) -> None:
+        raise NotImplementedError
 
 # Adaptee JSON Implementation of Adaptee Interface
 class JsonLogger(Logger):
@@ -25,14 +36,12 @@ class XmlData:
         self.data = data
 
 # Client/Target Interface
-class XmlLogger(ABC):
-    @abstractmethod
-    def logXmlData(data: XmlData) -> None:
-        pass
+class XmlLogger:
+    def logXmlData(self, data: XmlData) -> None:
+        raise NotImplementedError
 
-    @abstractmethod
-    def setLogger(logger: Logger) -> None:
-        pass
+    def setLogger(self, logger: Logger) -> None:
+        raise NotImplementedError
 
 # Adapter
 class XmlToJsonYamlAdapter(XmlLogger):
@@ -41,10 +50,8 @@ class XmlToJsonYamlAdapter(XmlLogger):
         self.logger = logger
     
     def logXmlData(self, xmlData: XmlData) -> None:
-        # Use a regular expression to find the content between the <message> tags
-        match = search(r'<message>(.*?)</message>', xmlData.data)
-        if match:
-            message_content = match.group(1)
+        message_content = extractMessage(xmlData.data)
+        if message_content is not None:
             self.logger.log(message_content)
         else:
             print("No message tag found.")
@@ -1,12 +1,8 @@
-from abc import ABC, abstractmethod
-
-class ImplementationInterface(ABC):
-    @abstractmethod
-    def operation1() -> None:
-        pass
-    @abstractmethod
-    def operation2() -> None:
-        pass
+class ImplementationInterface:
+    def operation1(self) -> None:
+        raise NotImplementedError
+    def operation2(self) -> None:
+        raise NotImplementedError
 
 class ConcreteImplementationA(ImplementationInterface):
     def operation1(self) -> None:
@@ -1,25 +1,23 @@
-from abc import ABC, abstractmethod
-from typing import List
+from typing import Dict
 
-class Component(ABC):
+class Component:
     def add(self, component: 'Component') -> None:
         pass
 
     def remove(self, component: 'Component') -> None:
         pass
 
-    def get(name: str) -> 'Component':
+    def get(self, name: str) -> 'Component':
         pass
 
-    def getName() -> str:
+    def getName(self) -> str:
         pass
     
-    def display() -> None:
+    def display(self) -> None:
         pass
 
-    @abstractmethod
-    def operation() -> None:
-        pass
+    def operation(self) -> None:
+        raise NotImplementedError
 
 # Primitive Component A
 class PrimitiveComponentA(Component):
@@ -39,26 +37,24 @@ class PrimitiveComponentA(Component):
 class CompositeComponent(Component):
     def __init__(self, name: str) -> None:
         self.name = name
-        self.components: List[Component] = []
+        # Children keyed by name; dicts keep insertion order so display() is unchanged
+        self.components: Dict[str, Component] = {}
 
     def add(self, component: Component) -> None:
-        self.components.append(component)
+        self.components[component.getName()] = component
 
     def remove(self, component: Component) -> None:
-        self.components = [comp for comp in self.components if comp.getName() != component.getName()]
+        self.components.pop(component.getName(), None)
     
     def get(self, name: str) -> Component:
-        for component in self.components:
-            if component.getName() == name:
-                return component
-        return None
+        return self.components.get(name)
     
     def getName(self) -> str:
         return self.name
 
     def display(self) -> None:
         print(f'Composite Component: {self.name}')
-        for c in self.components:
+        for c in self.components.values():
             c.display()
 
     def operation(self) -> None:
@@ -1,16 +1,17 @@
-from abc import ABC, abstractmethod
-
-class Component(ABC):
-    @abstractmethod
-    def operation() -> str:
-        pass
+class Component:
+    def operation(self) -> str:
+        raise NotImplementedError
 
 class ConcreteComponent(Component):
     def operation(self) -> str:
         return "ConcreteComponent"
 
+# The components here are stateless, so each decorator caches its result on the
+# first operation(). The cache assumes _component is never reassigned afterwards.
+# Subclasses only override _render to wrap the inner result.
 class BaseDecorator(Component):
     _component: Component = None
+    _result: str = None
 
     def __init__(self, component: Component) -> None:
         super().__init__()
@@ -20,16 +21,21 @@ class BaseDecorator(Component):
     def component(self):
         return self._component
 
+    def _render(self, inner: str) -> str:
+        return inner
+
     def operation(self) -> str:
-        return self.component.operation()
+        if self._result is None:
+            self._result = self._render(self.component.operation())
+        return self._result
 
 class ConcreteDecoratorA(BaseDecorator):
-    def operation(self) -> str:
-        return f"ConcreteDecoratorA({self.component.operation()})"
+    def _render(self, inner: str) -> str:
+        return f"ConcreteDecoratorA({inner})"
 
 class ConcreteDecoratorB(BaseDecorator):
-    def operation(self) -> str:
-        return f"ConcreteDecoratorB({self.component.operation()})"
+    def _render(self, inner: str) -> str:
+        return f"ConcreteDecoratorB({inner})"
 
 def main():
     # This way the client code can support both simple components...
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from tkinter import Tk, Canvas
 
 # Flyweight
@@ -14,15 +15,18 @@ class TreeType:
         canvas.create_text(x + width / 2, y + height / 2, text=f"{self.name}\n{self.texture}", fill='white')
 
 # Flyweight Factory
+# lru_cache keys on how the arguments were passed, not just their values, so the
+# public method always forwards them positionally to the cached helper. That way
+# the same (name, color, texture) always returns the same shared TreeType instance
 class TreeFactory:
-    tree_types = {}
+    @staticmethod
+    def get_tree_type(name, color, texture):
+        return TreeFactory._cached_tree_type(name, color, texture)
 
-    @classmethod
-    def get_tree_type(cls, name, color, texture):
-        key = (name, color, texture)
-        if key not in cls.tree_types:
-            cls.tree_types[key] = TreeType(name, color, texture)
-        return cls.tree_types[key]
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _cached_tree_type(name, color, texture):
+        return TreeType(name, color, texture)
 
 # Context
 class Tree:
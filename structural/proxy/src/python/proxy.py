@@ -1,53 +1,65 @@
+import logging
+import sys
+
+# Account activity is logged lazily: the message is only formatted when INFO is enabled
+logger = logging.getLogger(__name__)
 
 class BankAccount:
+    __slots__ = ('owner', 'balance')
+
     def __init__(self, owner, balance=0):
         self.owner = owner
         self.balance = balance
 
     def deposit(self, amount):
         self.balance += amount
-        print(f"Deposited ${amount}. New balance: ${self.balance}")
+        logger.info("Deposited $%s. New balance: $%s", amount, self.balance)
 
     def withdraw(self, amount):
         if amount > self.balance:
-            print("Insufficient funds")
+            logger.warning("Insufficient funds")
         else:
             self.balance -= amount
-            print(f"Withdrew ${amount}. New balance: ${self.balance}")
+            logger.info("Withdrew $%s. New balance: $%s", amount, self.balance)
 
     def get_balance(self):
         return self.balance
 
 
 class BankAccountProxy:
+    __slots__ = ('bank_account', '_can_view', '_can_modify')
+
     def __init__(self, owner, balance=0):
         self.bank_account = BankAccount(owner, balance)
-        self.permissions = {"view_balance": False, "modify_balance": False}
+        self._can_view = False
+        self._can_modify = False
 
     def set_permissions(self, view_balance=False, modify_balance=False):
-        self.permissions["view_balance"] = view_balance
-        self.permissions["modify_balance"] = modify_balance
+        self._can_view = view_balance
+        self._can_modify = modify_balance
 
     def deposit(self, amount):
-        if self.permissions["modify_balance"]:
+        if self._can_modify:
             self.bank_account.deposit(amount)
         else:
             print("Permission denied: Cannot deposit")
 
     def withdraw(self, amount):
-        if self.permissions["modify_balance"]:
+        if self._can_modify:
             self.bank_account.withdraw(amount)
         else:
             print("Permission denied: Cannot withdraw")
 
     def get_balance(self):
-        if self.permissions["view_balance"]:
+        if self._can_view:
             return self.bank_account.get_balance()
         else:
             print("Permission denied: Cannot view balance")
             return None
 
 def main():
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+
     # Example usage
     proxy = BankAccountProxy("Alice", 100)
     proxy.set_permissions(view_balance=True, modify_balance=False)